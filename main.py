@@ -1,20 +1,28 @@
+import os
+import re
 import sys
+import asyncio
 import platform
 import random
+import threading
 import time
+from collections import OrderedDict, deque
 from urllib.parse import quote, urlparse, parse_qs, unquote
 
-import requests
+import aiohttp
 from bs4 import BeautifulSoup
 
 from PyQt5.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit,
     QPushButton, QFrame, QSizePolicy, QScrollArea, QShortcut
 )
-from PyQt5.QtCore import Qt, QUrl, QTimer, QPropertyAnimation, QPoint, QEasingCurve, QObject, QRect
-from PyQt5.QtGui import QFont, QLinearGradient, QPainter, QColor, QBrush, QKeySequence, QCursor
+from PyQt5.QtCore import Qt, QUrl, QTimer, QPropertyAnimation, QParallelAnimationGroup, QSequentialAnimationGroup, QPoint, QEasingCurve, QObject, QRect, QEvent, QFile
+from PyQt5.QtGui import QFont, QFontMetrics, QLinearGradient, QPainter, QColor, QBrush, QKeySequence, QCursor, QPixmap
 from PyQt5.QtWebEngineWidgets import QWebEngineView
 
+# qasync binds to whichever Qt package is already imported, so keep it after PyQt5.
+import qasync
+
 from duckduckgo_search import DDGS
 
 # List of random prompts for the AI input box
@@ -34,10 +42,90 @@ STARTUP_TITLE_PROMPTS = [
     "What do you want to find?"
 ]
 
+# Input without spaces that contains a dot and is not an internal scheme
+_URL_RE = re.compile(r"(?!search://|startup://)[^ ]*\.[^ ]*")
+
+# User-Agent sent with every request made through the shared HTTP session
+HTTP_USER_AGENT = "Glidr/1.0"
+
+# Shared aiohttp session, created lazily on the running event loop.
+_AIO_SESSION = None
+
+# Long-lived DDGS clients, one per executor thread, so HTTP connections are
+# reused across searches without one slow query holding up the next.
+_DDGS_LOCAL = threading.local()
+_DDGS_CLIENTS = []
+_DDGS_LOCK = threading.Lock()
+
+# Memoized QFont instances keyed by (family, size, weight)
+_FONTS = {}
+
+def _font(family, size, weight=QFont.Normal):
+    """Return a shared QFont for the given family, size and weight."""
+    key = (family, size, weight)
+    font = _FONTS.get(key)
+    if font is None:
+        font = _FONTS[key] = QFont(family, size, weight)
+    return font
+
 def get_random_prompt(prompt_list):
     """Return a random prompt from the given list."""
     return random.choice(prompt_list)
 
+def get_aio_session():
+    """Return the shared aiohttp session, creating it on first use."""
+    global _AIO_SESSION
+    if _AIO_SESSION is None or _AIO_SESSION.closed:
+        _AIO_SESSION = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=16, limit_per_host=8, keepalive_timeout=60),
+            headers={"User-Agent": HTTP_USER_AGENT},
+        )
+    return _AIO_SESSION
+
+def _ddgs_client():
+    """Return the calling thread's DDGS client, creating it on first use."""
+    client = getattr(_DDGS_LOCAL, "client", None)
+    if client is None:
+        client = _DDGS_LOCAL.client = DDGS()
+        with _DDGS_LOCK:
+            _DDGS_CLIENTS.append(client)
+    return client
+
+def close_ddgs():
+    """Release every DDGS client opened by the search threads."""
+    with _DDGS_LOCK:
+        clients = _DDGS_CLIENTS[:]
+        _DDGS_CLIENTS.clear()
+    for client in clients:
+        client.__exit__(None, None, None)
+
+def load_stylesheet():
+    """
+    Load the application style sheet from the compiled Qt resource, falling
+    back to resources/style.qss when resources_rc.py has not been built.
+
+    Returns:
+        str: The style sheet, or an empty string if it could not be read.
+    """
+    try:
+        import resources_rc  # noqa: F401  (registers the :/ resources)
+        path = _STYLE_RESOURCE
+    except ImportError:
+        path = _STYLE_FILE
+    qss_file = QFile(path)
+    if not qss_file.open(QFile.ReadOnly | QFile.Text):
+        print("Could not load style sheet:", path)
+        return ""
+    try:
+        return bytes(qss_file.readAll()).decode("utf-8")
+    finally:
+        qss_file.close()
+
+async def close_aio_session():
+    """Close the shared aiohttp session if it was ever opened."""
+    if _AIO_SESSION is not None and not _AIO_SESSION.closed:
+        await _AIO_SESSION.close()
+
 def duckduckgo_search(query):
     """
     Retrieve DuckDuckGo search results for a given query using DDGS.
@@ -50,19 +138,16 @@ def duckduckgo_search(query):
     """
     results = []
     try:
-        with DDGS() as ddgs:
-            for i, r in enumerate(ddgs.text(query)):
-                title = r.get("title", "").strip()
-                href = r.get("href", "")
-                if title and href:
-                    results.append((title, href))
-                if len(results) >= 9:
-                    break
+        for r in _ddgs_client().text(query, max_results=9):
+            title = r.get("title", "").strip()
+            href = r.get("href", "")
+            if title and href:
+                results.append((title, href))
     except Exception as e:
         print("DuckDuckGo search failed:", e)
     return results
 
-def fetch_ai_summary(query):
+async def fetch_ai_summary(query):
     """
     Fetch a short AI-generated summary for the query.
 
@@ -78,10 +163,12 @@ def fetch_ai_summary(query):
     )
     url = f"https://text.pollinations.ai/{quote(prompt)}"
     try:
-        res = requests.get(url, timeout=10)
-        if res.status_code == 200:
-            return res.text.strip()
-    except requests.RequestException:
+        async with get_aio_session().get(url, timeout=aiohttp.ClientTimeout(total=10)) as res:
+            # Read the body even on errors so the connection goes back to the pool.
+            text = await res.text(errors="replace")
+            if res.status == 200:
+                return text.strip()
+    except (aiohttp.ClientError, asyncio.TimeoutError):
         return "GlidrAI response failed."
     return "No GlidrAI response."
 
@@ -95,11 +182,28 @@ def is_probable_url(text):
     Returns:
         bool: True if the text is a probable URL, False otherwise.
     """
-    if " " in text:
-        return False
-    if "." in text and not text.startswith("search://") and not text.startswith("startup://"):
-        return True
-    return False
+    return _URL_RE.fullmatch(text) is not None
+
+# Prefix written before each conversation entry in the AI prompt
+_ROLE_PREFIX = {"system": "[System]: ", "user": "[User]: ", "assistant": ""}
+
+# Style applied to the text label inside every chat bubble
+_LABEL_STYLE = "color: white; background: transparent; border: none; margin: 0px; padding: 0px;"
+
+# Tab overlay label styles for the normal and hovered state
+_TAB_NORMAL = "color: white; background: transparent; border: none; padding: 10px;"
+_TAB_DIM = "color: #aaa; background: transparent; border: none; padding: 10px;"
+
+# Most navigation entries kept; the oldest are dropped past this
+HISTORY_LIMIT = 500
+
+# Most search result widgets kept for reuse across searches
+RESULT_POOL_LIMIT = 200
+
+# Application style sheet. Widgets opt in to its rules through their object
+# names, so Qt parses it once instead of once per widget.
+_STYLE_RESOURCE = ":/style.qss"
+_STYLE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "resources", "style.qss")
 
 class GradientOverlay(QWidget):
     """A widget that provides a gradient overlay effect."""
@@ -109,28 +213,47 @@ class GradientOverlay(QWidget):
         self.setMinimumHeight(height)
         self.setAttribute(Qt.WA_TransparentForMouseEvents)
         self.setStyleSheet("background: transparent;")
+        self._top_color = QColor(self.color)
+        self._top_color.setAlpha(0)
+        self._bottom_color = QColor(self.color)
+        self._bottom_color.setAlpha(255)
+        self._grad = QLinearGradient(0, 0, 0, height)
+        self._grad.setColorAt(0, self._top_color)
+        self._grad.setColorAt(1, self._bottom_color)
+        self._brush = QBrush(self._grad)
 
     def paintEvent(self, _event):
         """Custom painting for vertical gradient overlay."""
-        painter = QPainter(self)
-        grad = QLinearGradient(0, 0, 0, self.height())
-        top_color = QColor(self.color)
-        top_color.setAlpha(0)
-        bottom_color = QColor(self.color)
-        bottom_color.setAlpha(255)
-        grad.setColorAt(0, top_color)
-        grad.setColorAt(1, bottom_color)
-        painter.fillRect(self.rect(), QBrush(grad))
+        QPainter(self).fillRect(self.rect(), self._brush)
 
     def resizeEvent(self, _event):
-        """Repaint gradient on resize."""
+        """Stretch the gradient to the new height and repaint."""
+        if self._grad.finalStop().y() != self.height():
+            self._grad.setFinalStop(0, self.height())
+            self._brush = QBrush(self._grad)
         self.update()
         super().resizeEvent(_event)
 
+class _HoverFilter(QObject):
+    """An event filter that swaps a widget's style sheet on hover."""
+    def __init__(self, normal_style, hover_style, parent=None):
+        super().__init__(parent)
+        self.normal_style = normal_style
+        self.hover_style = hover_style
+
+    def eventFilter(self, obj, event):
+        """Apply the hover style on enter and restore it on leave."""
+        if event.type() == QEvent.Enter:
+            obj.setStyleSheet(self.hover_style)
+        elif event.type() == QEvent.Leave:
+            obj.setStyleSheet(self.normal_style)
+        return False
+
 class TabOverlay(QFrame):
     """A widget that provides an overlay for tabs."""
     def __init__(self, parent=None):
         super().__init__(parent)
+        self._hover_filter = _HoverFilter(_TAB_NORMAL, _TAB_DIM, self)
         self.setStyleSheet("background: #1a1a1a; border: 1px solid #444444;")
         self.setFixedWidth(300)
         self.setWindowFlags(Qt.FramelessWindowHint | Qt.WindowStaysOnTopHint)
@@ -146,6 +269,7 @@ class TabOverlay(QFrame):
         self.tab_list_layout.setSpacing(0)
 
         self.layout.addWidget(self.tab_list)
+        self.tabs = []
 
         self.animation = QPropertyAnimation(self, b"geometry")
         self.animation.setDuration(250)
@@ -154,19 +278,26 @@ class TabOverlay(QFrame):
     def add_tab(self, title):
         """Add a tab to the overlay."""
         tab = QLabel(title)
-        tab.setFont(QFont("San Francisco", 17))
-        tab.setStyleSheet("color: white; background: transparent; border: none; padding: 10px;")
+        tab.setFont(_font("San Francisco", 17))
+        tab.setStyleSheet(_TAB_NORMAL)
         tab.setCursor(Qt.PointingHandCursor)
         tab.setFixedHeight(40)
-
-        def apply_dim(dimming):
-            color = "#aaa" if dimming else "white"
-            tab.setStyleSheet(f"color: {color}; background: transparent; border: none; padding: 10px;")
-
-        tab.enterEvent = lambda e: apply_dim(True)
-        tab.leaveEvent = lambda e: apply_dim(False)
-
+        tab.installEventFilter(self._hover_filter)
         self.tab_list_layout.addWidget(tab)
+        self.tabs.append(tab)
+
+    def set_tabs(self, titles):
+        """Show the given tab titles, only touching the tabs that changed."""
+        common = min(len(self.tabs), len(titles))
+        for tab, title in zip(self.tabs, titles[:common]):
+            if tab.text() != title:
+                tab.setText(title)
+        for tab in self.tabs[common:]:
+            self.tab_list_layout.removeWidget(tab)
+            tab.deleteLater()
+        del self.tabs[common:]
+        for title in titles[common:]:
+            self.add_tab(title)
 
     def show_animated(self):
         """Show the overlay with animation."""
@@ -188,40 +319,34 @@ class TabOverlay(QFrame):
 
 class ChatBubble(QFrame):
     """A widget that represents a chat bubble."""
+    _AI_STYLE = (
+        "background-color: transparent;"
+        "border: none;"
+        "margin: 0px;"
+        "padding: 0px;"
+    )
+    _USER_STYLE = (
+        "background-color: rgba(30,30,30,0.85);"
+        "border: 1px solid #444444;"
+        "border-radius: 10px;"
+        "margin: 0px;"
+        "padding: 16px;"
+    )
+
     def __init__(self, text, is_ai):
         super().__init__()
         self.is_ai = is_ai
         self.setMaximumWidth(600)
-        self.setStyleSheet(self._bubble_style())
+        self.setStyleSheet(self._AI_STYLE if is_ai else self._USER_STYLE)
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
         layout.setSpacing(0)
         self.label = QLabel(text)
         self.label.setWordWrap(True)
-        self.label.setFont(QFont("San Francisco", 18))
-        self.label.setStyleSheet(
-            "color: white; background: transparent; border: none; margin: 0px; padding: 0px;"
-        )
+        self.label.setFont(_font("San Francisco", 18))
+        self.label.setStyleSheet(_LABEL_STYLE)
         layout.addWidget(self.label)
 
-    def _bubble_style(self):
-        """Returns appropriate style string for user/AI bubble."""
-        if self.is_ai:
-            return (
-                "background-color: transparent;"
-                "border: none;"
-                "margin: 0px;"
-                "padding: 0px;"
-            )
-        else:
-            return (
-                "background-color: rgba(30,30,30,0.85);"
-                "border: 1px solid #444444;"
-                "border-radius: 10px;"
-                "margin: 0px;"
-                "padding: 16px;"
-            )
-
 class LoadingOverlay(QWidget):
     """A widget that provides a loading overlay effect."""
     def __init__(self, parent=None, text="✳︎ Glidr is working...", opacity=180):
@@ -241,11 +366,15 @@ class LoadingOverlay(QWidget):
 
     def set_opacity(self, opacity):
         """Set the opacity of the overlay."""
+        if opacity == self.bg_opacity:
+            return
         self.bg_opacity = opacity
         self.setStyleSheet(f"background: rgba(18, 18, 18, {self.bg_opacity});")
 
     def set_text(self, text):
         """Set the text of the overlay."""
+        if self.label.text() == text:
+            return
         self.label.setText(text)
 
     def resizeEvent(self, _event):
@@ -261,27 +390,37 @@ class AnimatedResultWidget(QWidget):
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
         layout.addWidget(child_widget)
-        self.setStyleSheet("background: transparent;")
+        self.setObjectName("animatedResult")
         self.setAttribute(Qt.WA_TranslucentBackground)
-        self.anim = None
+        self.anim = QPropertyAnimation(self, b"pos", self)
+        self.anim.setEasingCurve(QEasingCurve.OutCubic)
+        self._pending_anim = None
 
-    def animate_rise_from_bottom(self, parent_window, delay_ms=0, duration_ms=250):
+    def animate_rise_from_bottom(self, parent_window, duration_ms=250):
         """Animate widget rising from bottom of parent window."""
         self.show()
-        QApplication.processEvents()
-        start_y = parent_window.height()
-        final_x = self.x()
-        final_y = self.y()
-        self.move(final_x, start_y)
-        self.anim = QPropertyAnimation(self, b"pos", self)
-        self.anim.setStartValue(QPoint(final_x, start_y))
-        self.anim.setEndValue(QPoint(final_x, final_y))
+        # Start on the next event-loop tick, once the layout has placed the widget.
+        self._pending_anim = (parent_window, duration_ms)
+        QTimer.singleShot(0, self._do_animate)
+
+    def rise_animation(self, parent_window, duration_ms=250):
+        """Move widget below parent window and set up self.anim to bring it back to its place."""
+        final_pos = self.pos()
+        start_pos = QPoint(final_pos.x(), parent_window.height())
+        self.move(start_pos)
+        self.anim.setStartValue(start_pos)
+        self.anim.setEndValue(final_pos)
         self.anim.setDuration(duration_ms)
-        self.anim.setEasingCurve(QEasingCurve.OutCubic)
-        if delay_ms:
-            QTimer.singleShot(delay_ms, self.anim.start)
-        else:
-            self.anim.start()
+        return self.anim
+
+    def _do_animate(self):
+        """Start the rise animation requested by animate_rise_from_bottom."""
+        if self._pending_anim is None:
+            return
+        parent_window, duration_ms = self._pending_anim
+        self._pending_anim = None
+        self.anim.stop()
+        self.rise_animation(parent_window, duration_ms).start()
 
 class SmoothScroller(QObject):
     """A class that provides smooth scrolling functionality."""
@@ -311,23 +450,12 @@ class GlidrAIChatWidget(QWidget):
         self.ai_special_string = ai_special_string
         self.via_ai_box = via_ai_box
 
-        # Conversation memory stores system, user, and assistant messages.
-        self.memory = [{
-            "role": "system",
-            "content": (
-                "You are GlidrAI, a web browser AI assistant. Help users browse and answer questions. "
-                "No markdown formatting. "
-                "For navigation requests, respond ONLY with: "
-                f"{self.ai_special_string}(URL) "
-                f"Example: {self.ai_special_string}(https://www.google.com)"
-            )
-        }]
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(16)
+        self._resize_timer.timeout.connect(self._apply_overlay_geom)
 
-        if self.last_query:
-            self.memory.append({
-                "role": "user",
-                "content": f"Context: My previous search query was '{self.last_query}'. This may be relevant to my current request."
-            })
+        self._init_memory()
 
         self.main_layout = QVBoxLayout(self)
         self.main_layout.setContentsMargins(0, 0, 0, 0)
@@ -352,10 +480,59 @@ class GlidrAIChatWidget(QWidget):
         self.bottom_overlay = GradientOverlay(color="#121212", height=15, parent=self)
         self.bottom_overlay.hide()
 
-        self.working_bubble = None
+        self._response_task = None
 
         self.scroller = SmoothScroller(self.scroll_area.verticalScrollBar())
 
+    def _init_memory(self):
+        """Start a new conversation memory with the system and context entries."""
+        # Conversation memory stores system, user, and assistant messages.
+        # The percent-encoded prompt is extended alongside it, one entry at a time.
+        self.memory = []
+        self._encoded_prompt = ""
+        self.remember(
+            "system",
+            "You are GlidrAI, a web browser AI assistant. Help users browse and answer questions. "
+            "No markdown formatting. "
+            "For navigation requests, respond ONLY with: "
+            f"{self.ai_special_string}(URL) "
+            f"Example: {self.ai_special_string}(https://www.google.com)"
+        )
+
+        if self.last_query:
+            self.remember(
+                "user",
+                f"Context: My previous search query was '{self.last_query}'. This may be relevant to my current request."
+            )
+
+    def _header_text(self):
+        """Return the chat header, mentioning the search query when opened from the AI box."""
+        if self.last_query and self.via_ai_box:
+            return f'Chat with ✳︎ GlidrAI about "{self.last_query}"'
+        return "Chat with ✳︎ GlidrAI"
+
+    def reset(self, last_query=None, via_ai_box=False):
+        """Clear the conversation so the widget can be reused for a new chat."""
+        self.cancel_response()
+        self.last_query = last_query
+        self.via_ai_box = via_ai_box
+        self._init_memory()
+        self.header_label.setText(self._header_text())
+        self.remove_working_bubble()
+        while self.messages_layout.count():
+            item = self.messages_layout.takeAt(0)
+            row = item.layout()
+            if row is not None:
+                while row.count():
+                    child = row.takeAt(0).widget()
+                    if child is not None:
+                        child.deleteLater()
+                row.deleteLater()
+            elif item.widget() is not None:
+                item.widget().deleteLater()
+        self.input_field.clear()
+        self.input_field.setPlaceholderText(get_random_prompt(AI_INPUT_PROMPTS))
+
     def init_chat_area(self):
         """Initializes chat area UI components."""
         self.scroll_area = QScrollArea()
@@ -370,13 +547,9 @@ class GlidrAIChatWidget(QWidget):
         self.chat_layout.setContentsMargins(0, 0, 0, 0)
         self.chat_layout.setSpacing(30)
         # Header
-        if self.last_query and self.via_ai_box:
-            header_text = f'Chat with ✳︎ GlidrAI about "{self.last_query}"'
-        else:
-            header_text = "Chat with ✳︎ GlidrAI"
-        self.header_label = QLabel(header_text)
+        self.header_label = QLabel(self._header_text())
         self.header_label.setAlignment(Qt.AlignHCenter | Qt.AlignVCenter)
-        self.header_label.setFont(QFont("San Francisco", 25, QFont.Bold))
+        self.header_label.setFont(_font("San Francisco", 25, QFont.Bold))
         self.header_label.setStyleSheet(
             "color: white; background: transparent; padding: 0; "
             "margin-top: 215px; margin-bottom: 2px; border: none;"
@@ -385,12 +558,27 @@ class GlidrAIChatWidget(QWidget):
 
         self.subtitle_label = QLabel('Just start typing...\n"Bring me to the F1 website"\n"Write a text about pandas"\n"Explain AI to me"')
         self.subtitle_label.setAlignment(Qt.AlignHCenter | Qt.AlignTop)
-        self.subtitle_label.setFont(QFont("San Francisco", 15))
+        self.subtitle_label.setFont(_font("San Francisco", 15))
         self.subtitle_label.setStyleSheet(
             "color: #aaa; background: transparent; border: none; margin-top: 0px; margin-bottom: 40px;"
         )
         self.chat_layout.addWidget(self.subtitle_label, 0, Qt.AlignHCenter)
         self.chat_layout.addStretch(1)
+        # Messages get their own layout so new rows are appended at its end
+        # instead of being inserted in front of the trailing spacer.
+        self.messages_layout = QVBoxLayout()
+        self.messages_layout.setContentsMargins(0, 0, 0, 0)
+        self.messages_layout.setSpacing(30)
+        self.chat_layout.addLayout(self.messages_layout)
+        # A single working bubble sits below the messages and is only toggled.
+        self.working_bubble = ChatBubble("✳︎ GlidrAI is working...", True)
+        self.working_bubble.hide()
+        working_wrapper = QHBoxLayout()
+        working_wrapper.setContentsMargins(0, 0, 0, 0)
+        working_wrapper.setSpacing(0)
+        working_wrapper.addWidget(self.working_bubble, 0, Qt.AlignLeft)
+        working_wrapper.addStretch(1)
+        self.chat_layout.addLayout(working_wrapper)
         self.bottom_spacer = QWidget()
         self.bottom_spacer.setFixedHeight(10)
         self.chat_layout.addWidget(self.bottom_spacer)
@@ -417,7 +605,7 @@ class GlidrAIChatWidget(QWidget):
         # Use a random prompt for the AI input box
         self.input_field = QLineEdit()
         self.input_field.setPlaceholderText(get_random_prompt(AI_INPUT_PROMPTS))
-        self.input_field.setFont(QFont("San Francisco", 18))
+        self.input_field.setFont(_font("San Francisco", 18))
         self.input_field.setStyleSheet(
             "background: transparent;"
             "border: none;"
@@ -464,6 +652,12 @@ class GlidrAIChatWidget(QWidget):
             top_bar_height = getattr(self.parent(), "top_bar", None)
             top = top_bar_height.height() if top_bar_height else 72
             self.setGeometry(0, top, self.parent().width(), self.parent().height() - top)
+            # Coalesce overlay updates while the window is being dragged.
+            self._resize_timer.start()
+
+    def _apply_overlay_geom(self):
+        """Position the gradient overlays above and below the input area."""
+        if self.parent():
             if hasattr(self, "input_container") and hasattr(self, "gradient_overlay"):
                 input_geom = self.input_container.geometry()
                 gx = self.content_container.x() + input_geom.x()
@@ -493,21 +687,12 @@ class GlidrAIChatWidget(QWidget):
 
     def show_working_bubble(self):
         """Show a working bubble in the chat."""
-        self.remove_working_bubble()
-        self.working_bubble = ChatBubble("✳︎ GlidrAI is working...", True)
-        wrapper = QHBoxLayout()
-        wrapper.setContentsMargins(0, 0, 0, 0)
-        wrapper.setSpacing(0)
-        wrapper.addWidget(self.working_bubble, 0, Qt.AlignLeft)
-        wrapper.addStretch(1)
-        self.chat_layout.insertLayout(self.chat_layout.count() - 1, wrapper)
+        self.working_bubble.show()
         QTimer.singleShot(50, self.scroll_to_bottom_direct)
 
     def remove_working_bubble(self):
-        """Remove the working bubble from the chat."""
-        if self.working_bubble:
-            self.working_bubble.setParent(None)
-            self.working_bubble = None
+        """Hide the working bubble from the chat."""
+        self.working_bubble.hide()
 
     def add_bubble(self, text, is_ai):
         """Add a chat bubble to the chat."""
@@ -521,7 +706,7 @@ class GlidrAIChatWidget(QWidget):
         else:
             wrapper.addStretch(1)
             wrapper.addWidget(bubble, 0, Qt.AlignRight)
-        self.chat_layout.insertLayout(self.chat_layout.count() - 1, wrapper)
+        self.messages_layout.addLayout(wrapper)
         QTimer.singleShot(50, self.scroll_to_bottom_direct)
 
     def scroll_to_bottom_direct(self):
@@ -536,29 +721,42 @@ class GlidrAIChatWidget(QWidget):
 
     def send_message(self):
         """Send a message from the user."""
+        # One reply at a time; the text stays in the input until the pending reply arrives.
+        if self._response_task is not None:
+            return
         user_text = self.input_field.text().strip()
         if not user_text:
             return
         self.input_field.clear()
         self.add_bubble(user_text, False)
-        self.memory.append({"role": "user", "content": user_text})
+        self.remember("user", user_text)
         self.show_working_bubble()
-        QTimer.singleShot(100, self.get_ai_response)
+        self._response_task = asyncio.ensure_future(self.get_ai_response())
 
-    def get_ai_response(self):
+    def cancel_response(self):
+        """Cancel an AI request that is still in flight."""
+        if self._response_task and not self._response_task.done():
+            self._response_task.cancel()
+        self._response_task = None
+
+    async def get_ai_response(self):
         """Handles response from the AI, navigation or display."""
+        try:
+            response = await self.fetch_ai_response(self._encoded_prompt)
+        finally:
+            # A cancelled task may finish after a newer one was scheduled.
+            if self._response_task is asyncio.current_task():
+                self._response_task = None
         self.remove_working_bubble()
-        prompt_text = self.build_prompt()
-        response = self.fetch_ai_response(prompt_text)
         response = response.strip()
         nav_url = self.detect_ai_navigation(response)
         if nav_url and self.parent_glidr:
-            self.memory.append({"role": "assistant", "content": response})
+            self.remember("assistant", response)
             self.parent_glidr.search_input.setText(nav_url)
             self.parent_glidr.toggle_ai_interface()
             self.parent_glidr._navigate_to(nav_url)
             return
-        self.memory.append({"role": "assistant", "content": response})
+        self.remember("assistant", response)
         self.show_ai_response_animated(response)
 
     def detect_ai_navigation(self, response):
@@ -580,28 +778,22 @@ class GlidrAIChatWidget(QWidget):
             return url
         return None
 
-    def build_prompt(self):
-        """Formats conversation memory for AI prompt."""
-        conversation_text = ""
-        for entry in self.memory:
-            role = entry["role"]
-            content = entry["content"]
-            if role == "system":
-                conversation_text += f"[System]: {content}\n"
-            elif role == "user":
-                conversation_text += f"[User]: {content}\n"
-            elif role == "assistant":
-                conversation_text += f"{content}\n"
-        return conversation_text
-
-    def fetch_ai_response(self, prompt):
-        url = f"https://text.pollinations.ai/{requests.utils.quote(prompt)}"
+    def remember(self, role, content):
+        """Add an entry to conversation memory and to the encoded AI prompt."""
+        self.memory.append({"role": role, "content": content})
+        # quote() encodes character by character, so encoding only the new
+        # entry gives the same result as re-encoding the whole conversation.
+        self._encoded_prompt += quote(f"{_ROLE_PREFIX.get(role, '')}{content}\n")
+
+    async def fetch_ai_response(self, encoded_prompt):
+        url = f"https://text.pollinations.ai/{encoded_prompt}"
         try:
-            r = requests.get(url, timeout=15)
-            print("Response content:", r.text)
-            if r.status_code == 200:
-                return r.text.strip()
-        except requests.RequestException:
+            async with get_aio_session().get(url, timeout=aiohttp.ClientTimeout(total=15)) as r:
+                text = await r.text(errors="replace")
+                print("Response content:", text)
+                if r.status == 200:
+                    return text.strip()
+        except (aiohttp.ClientError, asyncio.TimeoutError):
             return "GlidrAI response failed."
         return "No GlidrAI response."
 
@@ -616,7 +808,7 @@ class GlidrAIChatWidget(QWidget):
         container = QWidget()
         container.setLayout(wrapper)
         animated = AnimatedResultWidget(container)
-        self.chat_layout.insertWidget(self.chat_layout.count() - 1, animated)
+        self.messages_layout.addWidget(animated)
         animated.animate_rise_from_bottom(self)
         QTimer.singleShot(300, self.scroll_to_bottom_smooth)
 
@@ -648,7 +840,7 @@ class StartupSearchWidget(QWidget):
         # Use a random prompt for the title text on startup
         self.header_label = QLabel(get_random_prompt(STARTUP_TITLE_PROMPTS))
         self.header_label.setAlignment(Qt.AlignHCenter | Qt.AlignVCenter)
-        self.header_label.setFont(QFont("San Francisco", 25, QFont.Bold))
+        self.header_label.setFont(_font("San Francisco", 25, QFont.Bold))
         self.header_label.setStyleSheet(
             "color: white; background: transparent; padding: 0; margin-bottom: 35px; border: none;"
         )
@@ -656,7 +848,7 @@ class StartupSearchWidget(QWidget):
 
         self.subtitle_label = QLabel("Just start typing...")
         self.subtitle_label.setAlignment(Qt.AlignHCenter | Qt.AlignTop)
-        self.subtitle_label.setFont(QFont("San Francisco", 15))
+        self.subtitle_label.setFont(_font("San Francisco", 15))
         self.subtitle_label.setStyleSheet(
             "color: #aaa; background: transparent; border: none; margin-bottom: 35px;"
         )
@@ -665,7 +857,7 @@ class StartupSearchWidget(QWidget):
         self.search_input = QLineEdit()
         self.search_input.setPlaceholderText(search_placeholder)
         self.search_input.setFixedHeight(43)
-        self.search_input.setFont(QFont("San Francisco", 17))
+        self.search_input.setFont(_font("San Francisco", 17))
         self.search_input.setStyleSheet(
             "background-color: #1a1a1a;"
             "border-radius: 10px;"
@@ -680,6 +872,11 @@ class StartupSearchWidget(QWidget):
         self.main_layout.addStretch(3)
         QTimer.singleShot(100, self.select_search_text)
 
+    def reset(self):
+        """Clear the search input and pick a new title prompt."""
+        self.search_input.clear()
+        self.header_label.setText(get_random_prompt(STARTUP_TITLE_PROMPTS))
+
     def select_search_text(self):
         """Select the search text."""
         self.search_input.setFocus()
@@ -705,15 +902,16 @@ class StartupSearchWidget(QWidget):
             return
         if hasattr(self.parent_glidr, "startup_search_trigger"):
             self.parent_glidr.startup_search_trigger(text)
-            self.hide()
-            self.deleteLater()
-            self.parent_glidr.startup_widget = None
 
 class Glidr(QWidget):
     """The main application widget."""
+    LOGO_TEXT = "✳︎ Glidr"
+    # Rendered logo pixmaps keyed by device pixel ratio.
+    _logo_pixmaps = {}
+
     def __init__(self):
         super().__init__()
-        self.history = []
+        self.history = deque(maxlen=HISTORY_LIMIT)
         self.current_index = -1
         self.last_query = ""
         self.ai_box = None
@@ -726,12 +924,21 @@ class Glidr(QWidget):
         self.loading_overlay = None
         self.has_searched = False
         self.tab_overlay = None
+        self._search_task = None
+        # Search result widgets keyed by URL, least recently shown first.
+        self._result_widget_pool = OrderedDict()
+        self._resize_pending = False
+        # Results waiting for the next tick to animate, and the animation running them.
+        self._rising_results = []
+        self._results_anim = None
+        # Enabled state of the back, forward and reload buttons, which start disabled.
+        self._nav_state = (False, False, False)
+        self._screen_tracked = False
 
         self.init_ui()
         self.setup_shortcuts()
         self.resize(1000, 700)
         self.setMinimumSize(800, 400)
-        self.web_view.urlChanged.connect(self.on_url_changed)
         QTimer.singleShot(0, self.show_startup_widget)
 
     def setup_shortcuts(self):
@@ -767,7 +974,6 @@ class Glidr(QWidget):
         )
         self.loading_overlay.show()
         self.loading_overlay.raise_()
-        QApplication.processEvents()
 
     def hide_loading_overlay(self):
         """Hide the loading overlay."""
@@ -777,7 +983,7 @@ class Glidr(QWidget):
     def init_ui(self):
         """Initialize the user interface."""
         self.setWindowTitle("Glidr")
-        self.setStyleSheet("background-color: #121212; color: white;")
+        self.setObjectName("glidr")
         self.main_layout = QVBoxLayout(self)
         self.main_layout.setContentsMargins(0, 0, 0, 0)
         self.main_layout.setSpacing(0)
@@ -785,46 +991,74 @@ class Glidr(QWidget):
         self.init_chat_area()
         self.init_web_view()
 
+    @classmethod
+    def logo_pixmap(cls, ratio):
+        """
+        Return the logo rendered once for a device pixel ratio.
+
+        Args:
+            ratio (float): The device pixel ratio of the target screen.
+
+        Returns:
+            QPixmap: The white logo text on a transparent background.
+        """
+        pixmap = cls._logo_pixmaps.get(ratio)
+        if pixmap is None:
+            font = _font("San Francisco", 25, QFont.Bold)
+            size = QFontMetrics(font).size(Qt.TextSingleLine, cls.LOGO_TEXT)
+            pixmap = QPixmap(size * ratio)
+            pixmap.setDevicePixelRatio(ratio)
+            pixmap.fill(Qt.transparent)
+            painter = QPainter(pixmap)
+            painter.setRenderHint(QPainter.TextAntialiasing)
+            painter.setFont(font)
+            painter.setPen(Qt.white)
+            painter.drawText(QRect(0, 0, size.width(), size.height()), Qt.AlignLeft | Qt.AlignVCenter, cls.LOGO_TEXT)
+            painter.end()
+            cls._logo_pixmaps[ratio] = pixmap
+        return pixmap
+
     def init_top_bar(self):
         """Setup top bar UI with search, navigation, and AI button."""
         self.top_bar = QFrame()
+        self.top_bar.setObjectName("topBar")
         self.top_bar.setFixedHeight(72)
-        self.top_bar.setStyleSheet(
-            "background-color: #171717;"
-            "border-bottom: 1px solid #444444;"
-        )
         self.top_layout = QHBoxLayout(self.top_bar)
         self.top_layout.setContentsMargins(0, 0, 0, 0)
         self.top_layout.setSpacing(0)
-        self.logo = QLabel("✳︎ Glidr")
-        self.logo.setFont(QFont("San Francisco", 25, QFont.Bold))
-        self.logo.setStyleSheet("background: transparent; padding: 0; margin: 0; border: none;")
+        self.logo = QLabel()
+        self.logo.setPixmap(self.logo_pixmap(self.devicePixelRatioF()))
+        self.logo.setObjectName("logo")
         self.top_layout.addWidget(self.logo, 0, Qt.AlignVCenter | Qt.AlignLeft)
         self.top_layout.addStretch(1)
         self.center_container = QWidget(self.top_bar)
+        self.center_container.setObjectName("topBarCenter")
         self.center_layout = QHBoxLayout(self.center_container)
         self.center_layout.setContentsMargins(0, 0, 0, 0)
         self.center_layout.setSpacing(6)
         self.search_input = QLineEdit()
         self.search_input.setPlaceholderText("Search")
         self.search_input.setFixedHeight(43)
-        self.search_input.setStyleSheet(self.input_style())
-        self.search_input.setFont(QFont("San Francisco", 17))
+        self.search_input.setObjectName("searchInput")
+        self.search_input.setFont(_font("San Francisco", 17))
         self.search_input.returnPressed.connect(self.top_bar_search_trigger)
         self.search_input.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
         self.reload_btn = QPushButton("↺")
         self.reload_btn.setFixedSize(43, 43)
-        self.reload_btn.setStyleSheet(self.button_style(enabled=False))
+        self.reload_btn.setObjectName("navBtn")
+        self.reload_btn.setEnabled(False)
         self.reload_btn.setCursor(Qt.PointingHandCursor)
         self.reload_btn.clicked.connect(self.reload_page)
         self.back_btn = QPushButton("←")
         self.back_btn.setFixedSize(43, 43)
-        self.back_btn.setStyleSheet(self.button_style(enabled=False))
+        self.back_btn.setObjectName("navBtn")
+        self.back_btn.setEnabled(False)
         self.back_btn.setCursor(Qt.PointingHandCursor)
         self.back_btn.clicked.connect(self.go_back)
         self.forward_btn = QPushButton("→")
         self.forward_btn.setFixedSize(43, 43)
-        self.forward_btn.setStyleSheet(self.button_style(enabled=False))
+        self.forward_btn.setObjectName("navBtn")
+        self.forward_btn.setEnabled(False)
         self.forward_btn.setCursor(Qt.PointingHandCursor)
         self.forward_btn.clicked.connect(self.go_forward)
         self.center_layout.addWidget(self.search_input)
@@ -835,11 +1069,11 @@ class Glidr(QWidget):
         self.center_container.raise_()
         self.ai_button_top_right = QPushButton("✳︎")
         self.ai_button_top_right.setFixedSize(43, 43)
-        self.ai_button_top_right.setStyleSheet(self.button_style())
+        self.ai_button_top_right.setObjectName("navBtn")
         self.ai_button_top_right.setCursor(Qt.PointingHandCursor)
         self.ai_button_top_right.clicked.connect(self.toggle_ai_interface)
         button_container = QWidget()
-        button_container.setStyleSheet("background: transparent; border: none;")
+        button_container.setObjectName("topBarButtons")
         button_container.setAttribute(Qt.WA_TranslucentBackground)
         button_layout = QVBoxLayout(button_container)
         button_layout.setContentsMargins(15, 15, 15, 15)
@@ -852,7 +1086,7 @@ class Glidr(QWidget):
         """Initialize the chat area."""
         self.scroll_area = QScrollArea()
         self.scroll_area.setWidgetResizable(True)
-        self.scroll_area.setStyleSheet("border: none;")
+        self.scroll_area.setObjectName("resultsArea")
         self.scroll_area.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
         self.scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
         self.scroll_area.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
@@ -870,45 +1104,18 @@ class Glidr(QWidget):
 
     def init_web_view(self):
         """Initialize the web view."""
-        self.web_view = QWebEngineView()
-        self.web_view.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
-        self.web_view.hide()
-        self.main_layout.addWidget(self.web_view)
-
-    def input_style(self):
-        """Return the style sheet for input fields."""
-        return (
-            "background-color: #1a1a1a;"
-            "border-radius: 10px;"
-            "border: 1px solid #444444;"
-            "padding: 0 14px;"
-            "color: white;"
-            "font-size: 17px;"
-            "font-family: 'San Francisco', -apple-system;"
-        )
-
-    def button_style(self, enabled=True):
-        """Return the style sheet for buttons."""
-        opacity = "1.0" if enabled else "0.5"
-        return (
-            "QPushButton {"
-            "background-color: #1a1a1a;"
-            f"color: rgba(255, 255, 255, {opacity});"
-            "border: 1px solid #444444;"
-            "border-radius: 10px;"
-            "font-family: 'San Francisco', -apple-system;"
-            "font-size: 19px;"
-            "font-weight: bold;"
-            "}"
-            "QPushButton:disabled {"
-            "background-color: #1a1a1a;"
-            "color: rgba(255,255,255,0.5);"
-            "border: 1px solid #444444;"
-            "}"
-            "QPushButton:hover:!disabled {"
-            "background-color: #333;"
-            "}"
-        )
+        # Built on the first page load, so startup does not launch the web engine process.
+        self.web_view = None
+
+    def _ensure_web_view(self):
+        """Create the web view if it does not exist yet and return it."""
+        if self.web_view is None:
+            self.web_view = QWebEngineView()
+            self.web_view.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+            self.web_view.hide()
+            self.web_view.urlChanged.connect(self.on_url_changed)
+            self.main_layout.addWidget(self.web_view)
+        return self.web_view
 
     def show_ai_close_button(self):
         """Display the close ("×") button for the AI chat interface."""
@@ -918,8 +1125,8 @@ class Glidr(QWidget):
             return
         self.ai_close_btn = QPushButton("×", self)
         self.ai_close_btn.setFixedSize(43, 43)
-        self.ai_close_btn.setStyleSheet(self.button_style())
-        self.ai_close_btn.setFont(QFont("San Francisco", 25, QFont.Bold))
+        self.ai_close_btn.setObjectName("navBtn")
+        self.ai_close_btn.setFont(_font("San Francisco", 25, QFont.Bold))
         self.ai_close_btn.setCursor(Qt.PointingHandCursor)
         self.ai_close_btn.clicked.connect(self.toggle_ai_interface)
         self.ai_close_btn.setToolTip("Close AI chat")
@@ -936,6 +1143,17 @@ class Glidr(QWidget):
         super().showEvent(event)
         if self.ai_close_btn and self.ai_close_btn.isVisible():
             self.update_ai_close_button_geometry()
+        # The native window exists from the first show; follow it across screens from then on.
+        window = self.windowHandle()
+        if window is not None and not self._screen_tracked:
+            self._screen_tracked = True
+            window.screenChanged.connect(self.on_screen_changed)
+            self.on_screen_changed(window.screen())
+
+    def on_screen_changed(self, screen):
+        """Render the logo for the device pixel ratio of the window's new screen."""
+        if screen is not None:
+            self.logo.setPixmap(self.logo_pixmap(screen.devicePixelRatio()))
 
     def update_ai_close_button_geometry(self):
         """Update the geometry of the AI close button."""
@@ -962,9 +1180,13 @@ class Glidr(QWidget):
                 last_query = self.last_query_for_ai
             else:
                 last_query = None
-            self.glidrai_chat_widget = GlidrAIChatWidget(self, last_query=last_query, via_ai_box=via_ai_box)
-            self.glidrai_chat_widget.setParent(self)
-            self.glidrai_chat_widget.setWindowFlags(Qt.Widget | Qt.FramelessWindowHint)
+            # The chat widget is built on first use and reset on every later show.
+            if self.glidrai_chat_widget is None:
+                self.glidrai_chat_widget = GlidrAIChatWidget(self, last_query=last_query, via_ai_box=via_ai_box)
+                self.glidrai_chat_widget.setParent(self)
+                self.glidrai_chat_widget.setWindowFlags(Qt.Widget | Qt.FramelessWindowHint)
+            else:
+                self.glidrai_chat_widget.reset(last_query=last_query, via_ai_box=via_ai_box)
             self.update_glidrai_chat_geometry()
             QTimer.singleShot(0, self.update_glidrai_chat_geometry)
             self.glidrai_chat_widget.show()
@@ -973,16 +1195,15 @@ class Glidr(QWidget):
             self.show_ai_close_button()
         else:
             if self.glidrai_chat_widget:
+                self.glidrai_chat_widget.cancel_response()
                 self.glidrai_chat_widget.hide()
-                self.glidrai_chat_widget.deleteLater()
-                self.glidrai_chat_widget = None
             self.hide_ai_close_button()
             if (not self.has_searched) or (self.current_index >= 0 and self.history and self.history[self.current_index] == "startup://"):
                 QTimer.singleShot(150, self.focus_best_search_bar)
 
     def update_glidrai_chat_geometry(self):
         """Ensure AI chat widget geometry matches current window."""
-        if self.glidrai_chat_widget:
+        if self.ai_mode:
             top_bar_height = self.top_bar.height()
             if top_bar_height == 0:
                 top_bar_height = 72
@@ -997,21 +1218,20 @@ class Glidr(QWidget):
 
     def show_startup_widget(self):
         """Display the startup widget and update history."""
-        self.history = self.history[: self.current_index + 1]
-        if not self.history or self.history[-1] != "startup://":
-            self.history.append("startup://")
-            self.current_index = len(self.history) - 1
+        self._push_history("startup://")
         self.update_nav_buttons()
         self.search_input.setText("")
-        if hasattr(self, "startup_widget") and self.startup_widget:
-            self.startup_widget.hide()
-            self.startup_widget.deleteLater()
-        self.web_view.hide()
+        if self.web_view:
+            self.web_view.hide()
         self.scroll_area.show()
         self.clear_results()
-        self.startup_widget = StartupSearchWidget(self)
-        self.startup_widget.setParent(self)
-        self.startup_widget.setWindowFlags(Qt.Widget | Qt.FramelessWindowHint)
+        # The startup widget is built on first use and reset on every later show.
+        if self.startup_widget is None:
+            self.startup_widget = StartupSearchWidget(self)
+            self.startup_widget.setParent(self)
+            self.startup_widget.setWindowFlags(Qt.Widget | Qt.FramelessWindowHint)
+        else:
+            self.startup_widget.reset()
         self.startup_widget.setGeometry(0, self.top_bar.height(), self.width(), self.height() - self.top_bar.height())
         self.startup_widget.show()
         self.startup_widget.raise_()
@@ -1029,12 +1249,22 @@ class Glidr(QWidget):
 
     def clear_results(self):
         """Remove all result widgets from the results container."""
+        self._cancel_search()
+        self._rising_results = []
+        self._stop_results_animation()
         self.clear_ai_box()
+        # Result widgets stay in the pool, hidden, so the next search can reuse them.
         while self.results_layout.count():
-            item = self.results_layout.takeAt(0)
-            widget = item.widget()
+            widget = self.results_layout.takeAt(0).widget()
             if widget:
-                widget.deleteLater()
+                widget.hide()
+
+    def _cancel_search(self):
+        """Abandon a search whose results have not been shown yet."""
+        if self._search_task and not self._search_task.done():
+            self._search_task.cancel()
+            self.hide_loading_overlay()
+        self._search_task = None
 
     def update_ai_box_width(self):
         """Adjust AI box width when resizing."""
@@ -1048,15 +1278,14 @@ class Glidr(QWidget):
         """Unified entry point for search from either startup or top bar."""
         if self.startup_widget:
             self.startup_widget.hide()
-            self.startup_widget.deleteLater()
-            self.startup_widget = None
         self.search_input.setText(text)
-        self.web_view.hide()
+        if self.web_view:
+            self.web_view.hide()
         self.scroll_area.show()
         self.clear_results()
 
         self.has_searched = True
-        if self.glidrai_chat_widget:
+        if self.ai_mode:
             self.toggle_ai_interface()
         # Improved URL detection logic.
         if is_probable_url(text):
@@ -1066,14 +1295,11 @@ class Glidr(QWidget):
             return
 
         entry = f"search://{text}"
-        self.history = self.history[: self.current_index + 1]
-        if not self.history or self.history[-1] != entry:
-            self.history.append(entry)
-            self.current_index = len(self.history) - 1
+        if self._push_history(entry):
             self.last_query_for_ai = text
 
         self.show_loading_overlay(full_opacity=full_overlay)
-        QTimer.singleShot(100, lambda: self._load_search_results(text))
+        self._search_task = asyncio.ensure_future(self._load_search_results(text))
         self.update_nav_buttons()
 
     def top_bar_search_trigger(self):
@@ -1097,49 +1323,89 @@ class Glidr(QWidget):
         """Load a search page."""
         self.unified_search_trigger(query, full_overlay=full_overlay)
 
-    def _load_search_results(self, query):
+    async def _load_search_results(self, query):
         """Fetches and displays AI and search results."""
         self.has_searched = True
-        ai_result = fetch_ai_summary(query)
-        results = duckduckgo_search(query)
+        # Yield one event-loop iteration so the loading overlay is painted first.
+        await asyncio.sleep(0)
+        # The summary and the search are independent, so wait on both at once.
+        # DDGS is a blocking client, so it runs on a worker thread of the loop's executor.
+        loop = asyncio.get_running_loop()
+        ai_result, results = await asyncio.gather(
+            fetch_ai_summary(query),
+            loop.run_in_executor(None, duckduckgo_search, query),
+        )
         self.hide_loading_overlay()
         widgets = []
         ai_widget = self._make_ai_box_widget(ai_result)
         animated_ai = AnimatedResultWidget(ai_widget)
-        self.results_layout.addWidget(animated_ai)
         self.ai_box = animated_ai
         widgets.append(animated_ai)
 
         for title, url in results:
-            result_widget = self._make_result_widget(title, url)
-            animated_result = AnimatedResultWidget(result_widget)
-            self.results_layout.addWidget(animated_result)
-            widgets.append(animated_result)
+            animated = self._pooled_result_widget(title, url)
+            if animated not in widgets:
+                widgets.append(animated)
+
+        # Insert every widget while the layout is disabled so Qt lays them out in one pass.
+        self.results_container.setUpdatesEnabled(False)
+        self.results_layout.setEnabled(False)
+        for widget in widgets:
+            self.results_layout.addWidget(widget)
+        self.results_layout.setEnabled(True)
+        self.results_container.setUpdatesEnabled(True)
         self.update_ai_box_width()
 
-        delay_step = 100
-        for idx, widget in enumerate(widgets):
-            widget.animate_rise_from_bottom(self, delay_ms=idx * delay_step)
+        # The animation starts on the next event-loop tick, after that single layout pass.
+        for widget in widgets:
+            widget.show()
+        self._rising_results = widgets
+        QTimer.singleShot(0, self._start_results_animation)
         self.update_nav_buttons()
 
+    def _start_results_animation(self, delay_step=100):
+        """Raise the pending results from the bottom, one after another, in one animation group."""
+        widgets, self._rising_results = self._rising_results, []
+        if not widgets:
+            return
+        group = QParallelAnimationGroup(self)
+        for idx, widget in enumerate(widgets):
+            sequence = QSequentialAnimationGroup()
+            if idx:
+                sequence.addPause(idx * delay_step)
+            sequence.addAnimation(widget.rise_animation(self))
+            group.addAnimation(sequence)
+        self._results_anim = group
+        group.finished.connect(self._stop_results_animation)
+        group.start()
+
+    def _stop_results_animation(self):
+        """Stop the results animation and release it."""
+        group = self._results_anim
+        if group is not None:
+            group.stop()
+            # The rise animations are the widgets' own; take them back before the group is deleted.
+            for idx in range(group.animationCount()):
+                sequence = group.animationAt(idx)
+                anim = sequence.takeAnimation(sequence.animationCount() - 1)
+                anim.setParent(anim.targetObject())
+            group.deleteLater()
+            self._results_anim = None
+
     def _make_ai_box_widget(self, text):
         """Creates the AI result widget."""
         box = QFrame()
-        box.setStyleSheet(
-            "background-color: #1a1a1a;"
-            "border: 1px solid #444444;"
-            "border-radius: 10px;"
-        )
+        box.setObjectName("aiBox")
         layout = QVBoxLayout(box)
         layout.setContentsMargins(24, 24, 24, 24)
         title_layout = QHBoxLayout()
         title_label = QLabel("AI Result")
-        title_label.setFont(QFont("San Francisco", 22, QFont.Bold))
-        title_label.setStyleSheet("color: white; background: transparent; border: none;")
+        title_label.setFont(_font("San Francisco", 22, QFont.Bold))
+        title_label.setObjectName("aiBoxTitle")
         title_layout.addWidget(title_label)
         self.ai_button_inside_ai_box = QPushButton("✳︎")
         self.ai_button_inside_ai_box.setFixedSize(43, 43)
-        self.ai_button_inside_ai_box.setStyleSheet(self.button_style())
+        self.ai_button_inside_ai_box.setObjectName("navBtn")
         self.ai_button_inside_ai_box.setCursor(Qt.PointingHandCursor)
         self.ai_button_inside_ai_box.clicked.connect(lambda: self.toggle_ai_interface(via_ai_box=True))
         title_layout.addStretch()
@@ -1147,12 +1413,27 @@ class Glidr(QWidget):
         layout.addLayout(title_layout)
         content = QLabel(text)
         content.setWordWrap(True)
-        content.setFont(QFont("San Francisco", 17))
-        content.setStyleSheet("color: white; background: transparent; border: none;")
+        content.setFont(_font("San Francisco", 17))
+        content.setObjectName("aiBoxText")
         content.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Preferred)
         layout.addWidget(content)
         return box
 
+    def _pooled_result_widget(self, title, url):
+        """Return the result widget for a URL, reusing a pooled one when possible."""
+        pool = self._result_widget_pool
+        animated = pool.get(url)
+        if animated is not None:
+            animated.child_widget.title_label.setText(title)
+            pool.move_to_end(url)
+            return animated
+        animated = AnimatedResultWidget(self._make_result_widget(title, url))
+        pool[url] = animated
+        if len(pool) > RESULT_POOL_LIMIT:
+            _, evicted = pool.popitem(last=False)
+            evicted.deleteLater()
+        return animated
+
     def _make_result_widget(self, title_text, url):
         """Creates a clickable search result widget."""
         container = QWidget()
@@ -1163,32 +1444,22 @@ class Glidr(QWidget):
         font_size = 17
         title = QLabel(title_text)
         title.setWordWrap(True)
-        title.setFont(QFont(font_family, font_size, QFont.Bold))
-        title.setStyleSheet("color: white;")
+        title.setFont(_font(font_family, font_size, QFont.Bold))
+        title.setObjectName("resultTitle")
         title.setCursor(Qt.PointingHandCursor)
         url_label = QLabel(url)
         url_label.setWordWrap(True)
-        url_label.setFont(QFont(font_family, font_size))
-        url_label.setStyleSheet("color: #ccc;")
+        url_label.setFont(_font(font_family, font_size))
+        url_label.setObjectName("resultUrl")
         url_label.setCursor(Qt.PointingHandCursor)
         container_layout.addWidget(title)
         container_layout.addWidget(url_label)
 
-        def apply_dim(dimming: bool):
-            color_title = "#aaa" if dimming else "white"
-            color_url = "#888" if dimming else "#ccc"
-            title.setStyleSheet(f"color: {color_title};")
-            url_label.setStyleSheet(f"color: {color_url};")
-
-        title.enterEvent = lambda e: apply_dim(True)
-        title.leaveEvent = lambda e: apply_dim(False)
-        url_label.enterEvent = lambda e: apply_dim(True)
-        url_label.leaveEvent = lambda e: apply_dim(False)
-
         def open_link_event(event):
             self._navigate_to(url)
         title.mousePressEvent = open_link_event
         url_label.mousePressEvent = open_link_event
+        container.title_label = title
         return container
 
     def _navigate_to(self, url):
@@ -1202,14 +1473,12 @@ class Glidr(QWidget):
         if hasattr(self, "scroll_area") and self.scroll_area:
             self.scroll_area.hide()
         # Show the web view and load the page.
+        self._ensure_web_view()
         self.web_view.show()
         self.web_view.raise_()
         self.web_view.load(QUrl(url))
         self.search_input.setText(url)
-        self.history = self.history[: self.current_index + 1]
-        if not self.history or self.history[-1] != url:
-            self.history.append(url)
-            self.current_index = len(self.history) - 1
+        self._push_history(url)
         self.ignore_url_add = True
         self.update_nav_buttons()
         self.search_input.clearFocus()
@@ -1223,10 +1492,7 @@ class Glidr(QWidget):
         if self.current_index >= 0 and self.history[self.current_index] == new_url:
             self.search_input.setText(new_url)
             return
-        self.history = self.history[: self.current_index + 1]
-        if not self.history or self.history[-1] != new_url:
-            self.history.append(new_url)
-            self.current_index = len(self.history) - 1
+        if self._push_history(new_url):
             self.search_input.setText(new_url)
         self.update_nav_buttons()
 
@@ -1257,6 +1523,7 @@ class Glidr(QWidget):
             self.unified_search_trigger(query, full_overlay=False)
             self.search_input.setText(query)
         else:
+            self._ensure_web_view()
             self.web_view.load(QUrl(entry))
             self.web_view.show()
             self.scroll_area.hide()
@@ -1281,6 +1548,7 @@ class Glidr(QWidget):
             self.unified_search_trigger(query, full_overlay=False)
             self.search_input.setText(query)
         else:
+            self._ensure_web_view()
             self.web_view.load(QUrl(entry))
             self.web_view.show()
             self.scroll_area.hide()
@@ -1289,20 +1557,22 @@ class Glidr(QWidget):
 
     def reload_page(self):
         """Reload the current web page if the web view is visible."""
-        if self.web_view.isVisible():
+        if self.web_view and self.web_view.isVisible():
             self.web_view.reload()
 
     def update_nav_buttons(self):
-        """Update the enabled/disabled state and style of navigation buttons."""
+        """Update the enabled/disabled state of navigation buttons."""
         back_enabled = self.current_index > 0
         forward_enabled = self.current_index < len(self.history) - 1
-        reload_enabled = self.web_view.isVisible()
-        self.back_btn.setEnabled(back_enabled)
-        self.forward_btn.setEnabled(forward_enabled)
-        self.reload_btn.setEnabled(reload_enabled)
-        self.back_btn.setStyleSheet(self.button_style(back_enabled))
-        self.forward_btn.setStyleSheet(self.button_style(forward_enabled))
-        self.reload_btn.setStyleSheet(self.button_style(reload_enabled))
+        reload_enabled = self.web_view is not None and self.web_view.isVisible()
+        state = (back_enabled, forward_enabled, reload_enabled)
+        if state == self._nav_state:
+            return
+        buttons = (self.back_btn, self.forward_btn, self.reload_btn)
+        for button, old, new in zip(buttons, self._nav_state, state):
+            if old != new:
+                button.setEnabled(new)
+        self._nav_state = state
 
     def resizeEvent(self, event):
         """Handles resizing of all major UI components to maintain layout."""
@@ -1312,6 +1582,16 @@ class Glidr(QWidget):
         max_width = self.width() - margin_lr * 2
         self.results_container.setMaximumWidth(max_width)
         self.center_container.setFixedWidth(max_width)
+        # A drag-resize sends many events per frame; place the overlays once, on the next tick.
+        if not self._resize_pending:
+            self._resize_pending = True
+            QTimer.singleShot(0, self._apply_resize)
+
+    def _apply_resize(self):
+        """Reposition the overlays and dependent widgets after a resize."""
+        self._resize_pending = False
+        self.setUpdatesEnabled(False)
+        max_width = self.center_container.width()
         top_bar_width = self.top_bar.width()
         center_x = (top_bar_width - max_width) // 2
         center_y = (self.top_bar.height() - self.center_container.height()) // 2
@@ -1320,7 +1600,7 @@ class Glidr(QWidget):
         self.update_ai_box_width()
         self.logo.setContentsMargins(24, 0, 0, 0)
         self.update_glidrai_chat_geometry()
-        if self.glidrai_chat_widget:
+        if self.ai_mode:
             self.glidrai_chat_widget.update_content_width(self.center_container.width(), top_margin=10, bottom_margin=10)
         if hasattr(self, "startup_widget") and self.startup_widget and self.startup_widget.isVisible():
             self.startup_widget.setGeometry(
@@ -1336,13 +1616,33 @@ class Glidr(QWidget):
                 0, self.top_bar.height(),
                 self.width(), self.height() - self.top_bar.height()
             )
+        self.setUpdatesEnabled(True)
 
     def clear_history(self):
         """Clear all navigation/search history and reset UI."""
-        self.history = []
+        self.history.clear()
         self.current_index = -1
         self.show_startup_widget()
 
+    def _push_history(self, entry):
+        """
+        Drop forward history and append an entry unless it is already current.
+
+        Args:
+            entry (str): The URL or internal (search://, startup://) entry.
+
+        Returns:
+            bool: True if the entry was appended, False otherwise.
+        """
+        while len(self.history) > self.current_index + 1:
+            self.history.pop()
+        appended = not self.history or self.history[-1] != entry
+        if appended:
+            self.history.append(entry)
+            self.current_index = len(self.history) - 1
+        self.update_tab_overlay()
+        return appended
+
     def enterEvent(self, event):
         """Handle mouse enter events for the main window."""
         super().enterEvent(event)
@@ -1368,51 +1668,25 @@ class Glidr(QWidget):
     def update_tab_overlay(self):
         """Update the tab overlay with current tabs."""
         if self.tab_overlay:
-            # Clear existing tabs
-            while self.tab_overlay.tab_list_layout.count():
-                item = self.tab_overlay.tab_list_layout.takeAt(0)
-                if item.widget():
-                    item.widget().deleteLater()
-
-            # Add current tabs
-            for index, entry in enumerate(self.history):
-                if entry != "startup://":
-                    self.tab_overlay.add_tab(f"Tab {index + 1}: {entry}")
+            self.tab_overlay.set_tabs([
+                f"Tab {index + 1}: {entry}"
+                for index, entry in enumerate(self.history)
+                if entry != "startup://"
+            ])
 
 
 if __name__ == "__main__":
     app = QApplication(sys.argv)
-    app.setStyleSheet("""
-        QScrollBar:vertical {
-            width: 6px;
-            background: rgba(0,0,0,0);
-            margin: 0px;
-        }
-        QScrollBar::handle:vertical {
-            background: rgba(51,51,51,128);
-            min-height: 40px;
-            border-radius: 3px;
-        }
-        QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
-            height: 0px;
-        }
-        QScrollBar:horizontal {
-            height: 6px;
-            background: rgba(0,0,0,0);
-            margin: 0px;
-        }
-        QScrollBar::handle:horizontal {
-            background: rgba(51,51,51,128);
-            min-width: 40px;
-            border-radius: 3px;
-        }
-        QScrollBar::add-line:horizontal, QScrollBar::sub-line:horizontal {
-            width: 0px;
-        }
-        """)
+    app.setStyleSheet(load_stylesheet())
+    app.aboutToQuit.connect(close_ddgs)
+    loop = qasync.QEventLoop(app)
+    asyncio.set_event_loop(loop)
     glidr = Glidr()
     glidr.show()
-    sys.exit(app.exec_())
+    with loop:
+        exit_code = loop.run_forever()
+        loop.run_until_complete(close_aio_session())
+    sys.exit(exit_code)
 
 
 #  ██████╗ ██╗     ██╗██████╗ ██████╗ 